@@ -13,11 +13,21 @@ Usage:
 import argparse
 import json
 import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 
 from email_parser import load_emails, group_by_project, load_colleagues, Email, Flag
 from detection import filter_noise, extract_signals, detect_resolutions
 from enrichment import enrich_flags, _api_key_available
 from report import generate_report
+import config
+
+
+def _process_one_project(job: tuple[str, list[Email]]) -> tuple[list[Email], int, list[Flag]]:
+    """Noise filter + signal extraction for one project. Top-level so a worker process can run it."""
+    project, emails = job
+    clean, noise_count = filter_noise(emails)
+    return clean, noise_count, extract_signals(clean, project)
 
 
 def _process_projects(
@@ -26,18 +36,26 @@ def _process_projects(
     """
     Per-project: noise filter + signal extraction.
     Returns (all_flags, email_counts, clean_project_emails, total_noise).
+    Projects share no state, so large inputs run in a process pool.
     """
     all_flags: list[Flag] = []
     email_counts: dict[str, int] = {}
     clean_emails: dict[str, list[Email]] = {}
     total_noise = 0
 
-    for project, emails in projects.items():
-        clean, noise_count = filter_noise(emails)
+    jobs = list(projects.items())
+    total_emails = sum(len(emails) for emails in projects.values())
+    if len(jobs) > 1 and total_emails >= config.PARALLEL_MIN_EMAILS:
+        with ProcessPoolExecutor(max_workers=config.PARALLEL_WORKERS) as pool:
+            results = list(pool.map(_process_one_project, jobs))
+    else:
+        results = [_process_one_project(job) for job in jobs]
+
+    for (project, _), (clean, noise_count, flags) in zip(jobs, results):
         total_noise += noise_count
         email_counts[project] = len(clean)
         clean_emails[project] = clean
-        all_flags.extend(extract_signals(clean, project))
+        all_flags.extend(flags)
 
     return all_flags, email_counts, clean_emails, total_noise
 
@@ -70,8 +88,9 @@ def run_pipeline(email_dir: str, output_path: str = "report.md", debug_path: str
     # --- 4. Resolution detection ---
     print("[Pipeline] Step 4: Detecting resolutions...")
     all_flags = detect_resolutions(all_flags, clean_project_emails)
-    metrics["open_flags"] = sum(1 for f in all_flags if f.status == "OPEN")
-    metrics["resolved_flags"] = sum(1 for f in all_flags if f.status == "RESOLVED")
+    status_counts = Counter(f.status for f in all_flags)
+    metrics["open_flags"] = status_counts["OPEN"]
+    metrics["resolved_flags"] = status_counts["RESOLVED"]
 
     # --- 5. LLM enrichment (optional) ---
     print("[Pipeline] Step 5: LLM enrichment...")
@@ -81,15 +100,19 @@ def run_pipeline(email_dir: str, output_path: str = "report.md", debug_path: str
         metrics["colleagues_loaded"] = len(role_map)
         all_flags = enrich_flags(all_flags, role_map)
         metrics["llm_enrichment"] = "enabled"
-        metrics["false_positives"] = sum(1 for f in all_flags if f.status == "FALSE_POSITIVE")
     else:
         metrics["llm_enrichment"] = "disabled"
 
     # --- 6. Report ---
     print("[Pipeline] Step 6: Generating report...")
-    project_flags: dict = {}
+    # one pass: group flags for the report and recount statuses after enrichment
+    project_flags: dict[str, list[Flag]] = {}
+    status_counts = Counter()
     for flag in all_flags:
         project_flags.setdefault(flag.project, []).append(flag)
+        status_counts[flag.status] += 1
+    if ai_used:
+        metrics["false_positives"] = status_counts["FALSE_POSITIVE"]
 
     report_md = generate_report(
         project_flags=project_flags,
@@ -100,12 +123,13 @@ def run_pipeline(email_dir: str, output_path: str = "report.md", debug_path: str
     # --- Write outputs ---
     metrics["runtime_seconds"] = round(time.time() - start_time, 2)
 
-    with open(output_path, "w", encoding="utf-8") as file:
-        file.write(report_md)
+    # encode once and write in binary mode — one write, no text-layer chunking
+    with open(output_path, "wb") as file:
+        file.write(report_md.encode("utf-8"))
     print(f"\n✅ Report written to {output_path}")
 
-    with open(debug_path, "w", encoding="utf-8") as file:
-        json.dump(metrics, file, indent=2)
+    with open(debug_path, "wb") as file:
+        file.write(json.dumps(metrics, indent=2).encode("utf-8"))
     print(f"✅ Debug metrics written to {debug_path}")
 
 
@@ -5,7 +5,7 @@ config.py — All tunable parameters. Change behaviour here, nowhere else.
 # ---------------------------------------------------------------------------
 # Action cues — regex patterns that signal a request, question, or task
 # ---------------------------------------------------------------------------
-ACTION_CUES: list[str] = [
+ACTION_CUES: tuple[str, ...] = (
     r"\bplease\b.*[\?!]",
     r"\bcan you\b",
     r"\bcould you\b",
@@ -30,12 +30,12 @@ ACTION_CUES: list[str] = [
     r"\bhow should we\b",
     r"\bwhat should\b",
     r"\bstill open\b",
-]
+)
 
 # ---------------------------------------------------------------------------
 # Risk cues — regex patterns that signal blockers, scope changes, risks
 # ---------------------------------------------------------------------------
-RISK_CUES: list[str] = [
+RISK_CUES: tuple[str, ...] = (
     r"\bnot included in the estimate\b",
     r"\bre-plan\b",
     r"\bextra effort\b",
@@ -54,12 +54,12 @@ RISK_CUES: list[str] = [
     r"\bnice to have\b",
     r"\bextra development\b",
     r"\bsidelined\b",
-]
+)
 
 # ---------------------------------------------------------------------------
 # Resolution cues — signals that an issue was addressed
 # ---------------------------------------------------------------------------
-RESOLUTION_CUES: list[str] = [
+RESOLUTION_CUES: tuple[str, ...] = (
     r"\bfixed\b",
     r"\bresolved\b",
     r"\bdone\b",
@@ -75,14 +75,14 @@ RESOLUTION_CUES: list[str] = [
     r"\bokay.*i.ll\b",
     r"\bthat.s clear\b",
     r"\bget it done\b",
-]
+)
 
 # ---------------------------------------------------------------------------
 # Correction cues — signals that a previous reply was wrong / overridden.
 # If a later email in the same thread matches one of these, the earlier
 # resolution candidate is invalidated (the flag stays OPEN).
 # ---------------------------------------------------------------------------
-CORRECTION_CUES: list[str] = [
+CORRECTION_CUES: tuple[str, ...] = (
     r"\bstop\b",
     r"\bno,\s",
     r"\bwait\b",
@@ -93,12 +93,12 @@ CORRECTION_CUES: list[str] = [
     r"\bthat.s not\b",
     r"\bdo not\b",
     r"\bdon.t\b",
-]
+)
 
 # ---------------------------------------------------------------------------
 # Noise keywords — social / off-topic content to filter
 # ---------------------------------------------------------------------------
-NOISE_KEYWORDS: list[str] = [
+NOISE_KEYWORDS: tuple[str, ...] = (
     r"\blunch\b",
     r"\brestaurant\b",
     r"\bpizza\b",
@@ -112,18 +112,18 @@ NOISE_KEYWORDS: list[str] = [
     r"\bnot meant for here\b",
     r"\bwasn.t meant for\b",
     r"\bwrong.*thread\b",
-]
+)
 
 # ---------------------------------------------------------------------------
 # Security — patterns that flag sensitive data before sending to LLM
 # ---------------------------------------------------------------------------
-SENSITIVE_DATA_PATTERNS: list[str] = [
+SENSITIVE_DATA_PATTERNS: tuple[str, ...] = (
     r"\bsk-[a-zA-Z0-9]{20,}\b",                       # OpenAI-style API keys
     r"\bpassword\s*[:=]\s*\S+",                        # password assignments
     r"\bsecret\s*[:=]\s*\S+",                          # secret assignments
     r"\btoken\s*[:=]\s*\S+",                           # token assignments
     r"\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b",   # credit card numbers
-]
+)
 
 # ---------------------------------------------------------------------------
 # Thresholds
@@ -133,6 +133,25 @@ NOISE_MAX_WORDS: int = 80                # noise messages must be shorter than t
 EVIDENCE_SNIPPET_LENGTH: int = 150       # chars of evidence snippet per flag
 MAX_EMAIL_BODY_LENGTH: int = 5000        # security: max chars per email body
 
+# ---------------------------------------------------------------------------
+# Regex engine — opt-in RE2 for cue matching (needs: pip install google-re2).
+# RE2 is linear-time, but its \b, \w and \s are ASCII-only: accented letters
+# ("ádone") and non-breaking spaces ("No,\u00a0that's") match differently than
+# with re, so detection results can change. Off by default for that reason.
+# ---------------------------------------------------------------------------
+USE_RE2: bool = False
+
+# ---------------------------------------------------------------------------
+# Parallelism — projects are independent, so detection can fan out to worker
+# processes, and file reads can overlap on threads. Below the thresholds,
+# pool start-up costs more than it saves.
+# ---------------------------------------------------------------------------
+PARALLEL_MIN_EMAILS: int = 5000          # min emails before using a process pool
+PARALLEL_MIN_FILES: int = 500            # min thread files before parsing in a process pool
+PARALLEL_WORKERS: int | None = None      # worker processes (None = os.cpu_count())
+IO_MIN_FILES: int = 32                   # min .txt files before reading on a thread pool
+IO_WORKERS: int = 16                     # reader threads for email file I/O
+
 # ---------------------------------------------------------------------------
 # LLM settings
 # ---------------------------------------------------------------------------
@@ -140,3 +159,4 @@ LLM_TIER1_MODEL: str = "gpt-4o-mini"
 LLM_TIER2_MODEL: str = "gpt-4o"
 LLM_TEMPERATURE: int = 0
 LLM_MAX_TOKENS: int = 300
+LLM_CONCURRENCY: int = 4                 # max in-flight LLM requests per tier
@@ -7,28 +7,135 @@ detection.py — The analytical core. Three stages in one module:
 
 All cue lists and thresholds are configurable via config.py.
 Zero LLM cost. Every flag carries a direct evidence snippet.
+
+Cue matching can opt in to Google's RE2 engine (USE_RE2 in config.py, needs
+google-re2) — linear time, so cues such as 'please.*[?!]' cannot backtrack
+badly on long bodies. RE2's \b and \s are ASCII-only, so it is off by default
+and the standard re module decides.
 """
 
+import importlib
 import re
+import types
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Protocol
 
 from email_parser import Email, Flag
 import config
 
+_re2: types.ModuleType | None = None
+if config.USE_RE2:
+    try:
+        _re2 = importlib.import_module("re2")  # optional: pip install google-re2
+    except ImportError:
+        pass
+
+
+class _CueMatch(Protocol):
+    """What the detectors use of a match — re and RE2 match objects both fit."""
+    @property
+    def lastgroup(self) -> str | None: ...
+    def start(self, group: int | str = 0, /) -> int: ...
+    def end(self, group: int | str = 0, /) -> int: ...
+
+
+class _CuePattern(Protocol):
+    """What the detectors use of a compiled cue set — re and RE2 patterns both fit."""
+    def search(self, string: str, pos: int = 0, endpos: int = ...) -> _CueMatch | None: ...
+    def match(self, string: str, pos: int = 0, endpos: int = ...) -> _CueMatch | None: ...
+
+
+# ---------------------------------------------------------------------------
+# Compiled cue sets
+# ---------------------------------------------------------------------------
+
+def _compile_union(patterns: tuple[str, ...]) -> _CuePattern:
+    """
+    Fold a cue list into one alternation, compiled once at import.
+    Each cue gets its own named group (c0, c1, …) so match.lastgroup says
+    which cue fired — one scan per body instead of one scan per cue.
+    Compiled with RE2 when USE_RE2 is set and google-re2 is installed;
+    a cue list using syntax RE2 lacks (lookbehind, backreferences) stays on re.
+    """
+    union = "|".join(f"(?P<c{i}>{p})" for i, p in enumerate(patterns))
+    if _re2 is not None:
+        try:
+            return _re2.compile(f"(?i){union}")  # type: ignore[no-any-return]
+        except _re2.error:
+            pass
+    return re.compile(union, re.IGNORECASE)
+
+
+def _compile_each(patterns: tuple[str, ...], union: _CuePattern) -> tuple[_CuePattern, ...]:
+    """
+    The cues of a union one by one, in list order, on the same engine the
+    union was compiled with — so the union and its per-cue patterns always
+    agree on whether a body matches.
+    """
+    if _re2 is None or isinstance(union, re.Pattern):
+        return tuple(re.compile(p, re.IGNORECASE) for p in patterns)
+    return tuple(_re2.compile(f"(?i){p}") for p in patterns)
+
+
+_NOISE_RE = _compile_union(config.NOISE_KEYWORDS)
+_ACTION_RE = _compile_union(config.ACTION_CUES)
+_RISK_RE = _compile_union(config.RISK_CUES)
+_RESOLUTION_RE = _compile_union(config.RESOLUTION_CUES)
+_CORRECTION_RE = _compile_union(config.CORRECTION_CUES)
+_NOISE_CUE_RES = _compile_each(config.NOISE_KEYWORDS, _NOISE_RE)
+_IF_THERE_RE = re.compile(r"\bif there\b", re.IGNORECASE)
+
+# resolution cues one by one, in list order — evidence quotes the first that matches
+_RESOLUTION_CUE_RES = _compile_each(config.RESOLUTION_CUES, _RESOLUTION_RE)
+
+# thresholds and cue lists, bound once at import so the per-email paths skip the module lookup
+_NOISE_MIN_HITS = config.NOISE_MIN_HITS
+_NOISE_MAX_WORDS = config.NOISE_MAX_WORDS
+_SNIPPET_LENGTH = config.EVIDENCE_SNIPPET_LENGTH
+_ACTION_CUES = config.ACTION_CUES
+_RISK_CUES = config.RISK_CUES
+
 
 # ---------------------------------------------------------------------------
 # 1. Noise filtering
 # ---------------------------------------------------------------------------
 
+def _count_noise_hits(body: str, limit: int) -> int:
+    """
+    Number of distinct noise keywords present in the body, capped at limit —
+    the scan stops as soon as the answer can no longer change.
+    Restarts one character past each hit so that a greedy keyword such as
+    'wrong.*thread' cannot swallow another keyword inside its span.
+    The union reports one keyword per position, so at each hit every keyword
+    not yet seen is tried there too ('birthday' and 'birthday party' both count).
+    """
+    seen: set[int] = set()
+    match = _NOISE_RE.search(body)
+    while match:
+        start = match.start()
+        for i, cue in enumerate(_NOISE_CUE_RES):
+            if i not in seen and cue.match(body, start):
+                seen.add(i)
+        if len(seen) >= limit:
+            break
+        match = _NOISE_RE.search(body, start + 1)
+    return min(len(seen), limit)
+
+
 def _is_noise(email: Email) -> bool:
     """
     Returns True if the email is social chatter / off-topic.
     Requires minimum keyword hits AND short message length —
     avoids false positives on work emails that mention 'lunch' in passing.
     """
-    body_lower = email.body.lower()
-    hits = sum(1 for pattern in config.NOISE_KEYWORDS if re.search(pattern, body_lower))
-    word_count = len(email.body.split())
-    return hits >= config.NOISE_MIN_HITS and word_count < config.NOISE_MAX_WORDS
+    # length gate first — long emails are never noise, so skip the keyword scan.
+    # maxsplit caps the word list: we only need to know if it reaches the limit
+    word_count = len(email.body.split(maxsplit=_NOISE_MAX_WORDS))
+    if word_count >= _NOISE_MAX_WORDS:
+        return False
+    return _count_noise_hits(email.body, _NOISE_MIN_HITS) >= _NOISE_MIN_HITS
 
 
 def filter_noise(emails: list[Email]) -> tuple[list[Email], int]:
@@ -49,17 +156,17 @@ def filter_noise(emails: list[Email]) -> tuple[list[Email], int]:
 # 2. Signal extraction
 # ---------------------------------------------------------------------------
 
-def _get_snippet(body: str, match: re.Match) -> str:  # type: ignore[type-arg]
+def _get_snippet(body: str, match: _CueMatch) -> str:
     """Extract a snippet around the matched pattern for evidence."""
     start = max(0, match.start() - 40)
     end = min(len(body), match.end() + 80)
     snippet = body[start:end].replace("\n", " ").strip()
-    if len(snippet) > config.EVIDENCE_SNIPPET_LENGTH:
-        snippet = snippet[:config.EVIDENCE_SNIPPET_LENGTH]
+    if len(snippet) > _SNIPPET_LENGTH:
+        snippet = snippet[:_SNIPPET_LENGTH]
     return snippet
 
 
-def _is_conditional(body_lower: str, match: re.Match) -> bool:
+def _is_conditional(body: str, match: _CueMatch) -> bool:
     """
     True if the cue match is neutralised by conditional framing.
 
@@ -71,56 +178,63 @@ def _is_conditional(body_lower: str, match: re.Match) -> bool:
     This covers "if there's any blocker", "if there are any blockers", etc.
     """
     look_back = max(0, match.start() - 40)
-    context = body_lower[look_back:match.start()]
-    return bool(re.search(r"\bif there\b", context))
+    return bool(_IF_THERE_RE.search(body, look_back, match.start()))
+
+
+def _first_cue(body: str, cues: _CuePattern) -> _CueMatch | None:
+    """
+    Earliest cue occurrence in the body that is not conditionally framed.
+    A conditional hit ("if there's any blocker") is skipped and the scan
+    resumes one character later, so a genuine occurrence further on still counts.
+    """
+    match = cues.search(body)
+    while match and _is_conditional(body, match):
+        match = cues.search(body, match.start() + 1)
+    return match
+
+
+def _cue_pattern(match: _CueMatch, patterns: tuple[str, ...]) -> str:
+    """The configured cue behind a union match — group c<i> is patterns[i]."""
+    return patterns[int(match.lastgroup[1:])]  # type: ignore[index]
 
 
 def extract_signals(emails: list[Email], project: str) -> list[Flag]:
     """
     Scan emails for action and risk candidates.
-    One action flag and one risk flag per email maximum.
+    One action flag and one risk flag per email maximum — the earliest
+    non-conditional cue in the body wins.
     Each flag carries a direct evidence snippet.
     """
     flags: list[Flag] = []
 
     for email in emails:
-        body_lower = email.body.lower()
-
         # --- Action cues ---
-        for pattern in config.ACTION_CUES:
-            match = re.search(pattern, body_lower)
-            if match:
-                if _is_conditional(body_lower, match):
-                    continue  # "if there's any blocker, let me know" — not a real request
-                flags.append(Flag(
-                    flag_type="UNRESOLVED_ACTION",
-                    status="OPEN",
-                    project=project,
-                    source_file=email.source_file,
-                    trigger_email_index=email.index_in_thread,
-                    trigger_snippet=_get_snippet(email.body, match),
-                    trigger_date=email.date,
-                    matched_cues=[pattern],
-                ))
-                break  # one action flag per email
+        match = _first_cue(email.body, _ACTION_RE)
+        if match:
+            flags.append(Flag(
+                flag_type="UNRESOLVED_ACTION",
+                status="OPEN",
+                project=project,
+                source_file=email.source_file,
+                trigger_email_index=email.index_in_thread,
+                trigger_snippet=_get_snippet(email.body, match),
+                trigger_date=email.date,
+                matched_cues=[_cue_pattern(match, _ACTION_CUES)],
+            ))
 
         # --- Risk cues ---
-        for pattern in config.RISK_CUES:
-            match = re.search(pattern, body_lower)
-            if match:
-                if _is_conditional(body_lower, match):
-                    continue  # "if there's any blocker" — conditional, not a stated blocker
-                flags.append(Flag(
-                    flag_type="RISK_BLOCKER",
-                    status="OPEN",
-                    project=project,
-                    source_file=email.source_file,
-                    trigger_email_index=email.index_in_thread,
-                    trigger_snippet=_get_snippet(email.body, match),
-                    trigger_date=email.date,
-                    matched_cues=[pattern],
-                ))
-                break  # one risk flag per email
+        match = _first_cue(email.body, _RISK_RE)
+        if match:
+            flags.append(Flag(
+                flag_type="RISK_BLOCKER",
+                status="OPEN",
+                project=project,
+                source_file=email.source_file,
+                trigger_email_index=email.index_in_thread,
+                trigger_snippet=_get_snippet(email.body, match),
+                trigger_date=email.date,
+                matched_cues=[_cue_pattern(match, _RISK_CUES)],
+            ))
 
     return flags
 
@@ -152,61 +266,164 @@ def _is_later(candidate: Email, flag: Flag) -> bool:
     return True
 
 
-def _extract_keywords(text: str) -> set[str]:
+# words of 3+ letters, either case — the length filter lives in the regex
+_WORD_RE = re.compile(r"[A-Za-zÁÉÍÓÖŐÚÜŰáéíóöőúüű]{3,}")
+
+_STOP_WORDS = frozenset({
+    "the", "a", "an", "is", "it", "to", "in", "on", "for", "and", "or",
+    "but", "of", "with", "this", "that", "we", "i", "you", "he", "she",
+    "hi", "thanks", "please", "thank", "ok", "okay", "yes", "no",
+    "regards", "best", "sorry", "sure", "also", "as", "at", "by", "do",
+    "if", "my", "not", "so", "up", "can", "will", "would", "could",
+    "should", "have", "has", "had", "been", "be", "are", "was", "were",
+    "get", "got", "just", "now", "then", "there", "here", "what", "how",
+    "when", "which", "who", "its", "our", "your", "their", "me", "him",
+    "her", "them", "us",
+})
+
+
+def _extract_keywords(text: str) -> frozenset[str]:
     """
     Pull meaningful words from a snippet for overlap checking.
     Strips common short/stop words so that shared fluff like 'the', 'it',
     'please' doesn't count as a topical match.
     """
-    stop = {
-        "the", "a", "an", "is", "it", "to", "in", "on", "for", "and", "or",
-        "but", "of", "with", "this", "that", "we", "i", "you", "he", "she",
-        "hi", "thanks", "please", "thank", "ok", "okay", "yes", "no",
-        "regards", "best", "sorry", "sure", "also", "as", "at", "by", "do",
-        "if", "my", "not", "so", "up", "can", "will", "would", "could",
-        "should", "have", "has", "had", "been", "be", "are", "was", "were",
-        "get", "got", "just", "now", "then", "there", "here", "what", "how",
-        "when", "which", "who", "its", "our", "your", "their", "me", "him",
-        "her", "them", "us",
-    }
-    words = re.findall(r"[a-záéíóöőúüű]+", text.lower())
-    return {w for w in words if len(w) > 2 and w not in stop}
+    words = (match.group().lower() for match in _WORD_RE.finditer(text))
+    return frozenset(w for w in words if w not in _STOP_WORDS)
+
 
+def _email_keywords(email: Email, keyword_cache: dict[int, frozenset[str]]) -> frozenset[str]:
+    """Keywords of an email body, extracted once per email and reused across flags."""
+    keywords = keyword_cache.get(id(email))
+    if keywords is None:
+        keywords = _extract_keywords(email.body)
+        keyword_cache[id(email)] = keywords
+    return keywords
 
-def _has_topic_overlap(flag: Flag, email: Email, min_shared: int = 2) -> bool:
+
+def _has_topic_overlap(
+    trigger_kw: frozenset[str],
+    email_kw: frozenset[str],
+    min_shared: int = 2,
+) -> bool:
     """
     True if the flag's trigger snippet and the candidate email share enough
     meaningful keywords to plausibly be about the same topic.
     Used only for cross-file resolution candidates — same-file matches skip this.
+    Both keyword sets are precomputed by the caller.
     """
-    trigger_kw = _extract_keywords(flag.trigger_snippet)
-    email_kw = _extract_keywords(email.body)
     shared = trigger_kw & email_kw
     return len(shared) >= min_shared
 
 
-def _is_corrected(resolution_email: Email, project_emails: list[Email]) -> bool:
+def _correction_indices(project_emails: list[Email]) -> dict[str, list[int]]:
+    """
+    source_file → sorted thread indices of the project's emails that carry a
+    correction cue. Each body is scanned once, however many candidates ask.
+    """
+    indices: dict[str, list[int]] = {}
+    for email in project_emails:
+        if _CORRECTION_RE.search(email.body):
+            indices.setdefault(email.source_file, []).append(email.index_in_thread)
+    for file_indices in indices.values():
+        file_indices.sort()
+    return indices
+
+
+def _is_corrected(resolution_email: Email, correction_indices: dict[str, list[int]]) -> bool:
     """
     True if a later email in the same thread contains a correction cue,
     meaning the resolution_email's intent was overridden.
     Example: Zsófia says "I'll uncheck it" but Anna replies "STOP, only
     modify the newsletter checkbox!" — the resolution is invalidated.
     """
+    file_indices = correction_indices.get(resolution_email.source_file, [])
+    return bisect_right(file_indices, resolution_email.index_in_thread) < len(file_indices)
+
+
+def _resolution_snippet(body: str) -> str:
+    """Evidence for a resolution: the first cue in list order, as configured."""
+    for cue in _RESOLUTION_CUE_RES:
+        match = cue.search(body)
+        if match:
+            start = max(0, match.start() - 40)
+            end = min(len(body), match.end() + 80)
+            return body[start:end].replace("\n", " ").strip()
+    return ""
+
+
+def _index_project(
+    project_emails: list[Email],
+) -> tuple[list[tuple[Email, str]], list[datetime]]:
+    """
+    One pass over a project: every email that carries a resolution cue and
+    is not overridden by a later correction, paired with its evidence snippet.
+    Built once per project and shared by every flag in it.
+
+    Returns (candidates, dates). Candidates are in chronological order, with
+    undated emails last (as group_by_project orders them). dates holds the
+    dates of the dated prefix, so a flag can bisect straight to its first
+    strictly later candidate.
+    """
+    correction_indices = _correction_indices(project_emails)
+    candidates: list[tuple[Email, str]] = []
     for email in project_emails:
-        if email.source_file != resolution_email.source_file:
+        if not _RESOLUTION_RE.search(email.body):
             continue
-        if email.index_in_thread <= resolution_email.index_in_thread:
+        # check if a later email in the same file overrides/corrects this one
+        # (e.g. "STOP, that's wrong") — if so it can never resolve anything
+        if _is_corrected(email, correction_indices):
             continue
-        body_lower = email.body.lower()
-        for pattern in config.CORRECTION_CUES:
-            if re.search(pattern, body_lower):
-                return True
-    return False
+        snippet = _resolution_snippet(email.body)
+        if not snippet:
+            continue  # nothing to quote — must not stop a flag's candidate walk
+        candidates.append((email, snippet))
 
+    candidates.sort(key=lambda c: c[0].date or datetime.max)
+    dates = [email.date for email, _ in candidates if email.date]
+    return candidates, dates
 
-def _find_resolution(flag: Flag, project_emails: list[Email]) -> str | None:
+
+def _later_candidates(
+    flag: Flag,
+    project_index: tuple[list[tuple[Email, str]], list[datetime]],
+) -> list[tuple[Email, str]]:
+    """
+    Candidates that can still be later than the flag. For a dated flag every
+    candidate dated at or before the trigger fails _is_later, so that prefix
+    is bisected away; undated flags get the full list.
     """
-    Scan later emails in the same project for resolution signals.
+    candidates, dates = project_index
+    if flag.trigger_date is None:
+        return candidates
+    return candidates[bisect_right(dates, flag.trigger_date):]
+
+
+def _find_resolution_single_file(
+    flag: Flag,
+    project_index: tuple[list[tuple[Email, str]], list[datetime]],
+) -> str | None:
+    """
+    _find_resolution for a project that is one thread — the flag's own file.
+    Every candidate is same-file, so there is no topic-overlap tier and no
+    keyword extraction: the first later candidate resolves the flag.
+    """
+    for email, snippet in _later_candidates(flag, project_index):
+        if email.index_in_thread == flag.trigger_email_index:
+            continue  # never resolve to the trigger email itself
+        if _is_later(email, flag):
+            return snippet
+    return None
+
+
+def _find_resolution(
+    flag: Flag,
+    project_index: tuple[list[tuple[Email, str]], list[datetime]],
+    keyword_cache: dict[int, frozenset[str]],
+) -> str | None:
+    """
+    Walk the project's resolution candidates (see _index_project) for one
+    that resolves this flag.
 
     Two tiers of matching:
       • Same file: any resolution cue after the trigger index is valid.
@@ -216,10 +433,14 @@ def _find_resolution(flag: Flag, project_emails: list[Email]) -> str | None:
         unrelated thread from resolving an unrelated flag.
 
     A flag can never resolve to the email that triggered it.
+    keyword_cache: id(email) → body keywords, shared across all flags.
     """
-    for email in project_emails:
+    source_file = flag.source_file
+    trigger_kw: frozenset[str] | None = None  # extracted on the first cross-file candidate
+
+    for email, snippet in _later_candidates(flag, project_index):
         # never let a flag resolve to its own trigger email
-        if (email.source_file == flag.source_file
+        if (email.source_file == source_file
                 and email.index_in_thread == flag.trigger_email_index):
             continue
 
@@ -227,26 +448,41 @@ def _find_resolution(flag: Flag, project_emails: list[Email]) -> str | None:
             continue
 
         # cross-file candidate: require topical overlap
-        if email.source_file != flag.source_file:
-            if not _has_topic_overlap(flag, email):
+        if email.source_file != source_file:
+            if trigger_kw is None:
+                trigger_kw = _extract_keywords(flag.trigger_snippet)
+            if not _has_topic_overlap(trigger_kw, _email_keywords(email, keyword_cache)):
                 continue
 
-        body_lower = email.body.lower()
-        for pattern in config.RESOLUTION_CUES:
-            match = re.search(pattern, body_lower)
-            if match:
-                # before accepting: check if a later email in the same file
-                # overrides/corrects this one (e.g. "STOP, that's wrong")
-                if _is_corrected(email, project_emails):
-                    break  # this candidate is invalidated, keep scanning
-                start = max(0, match.start() - 40)
-                end = min(len(email.body), match.end() + 80)
-                snippet = email.body[start:end].replace("\n", " ").strip()
-                return snippet
+        return snippet
 
     return None
 
 
+def _resolve_project(job: tuple[list[Flag], list[Email]]) -> list[tuple[str, str]]:
+    """
+    Resolution detection for the flags of one project.
+    Returns (status, resolution_snippet) per flag, in order — values rather
+    than mutation, so the job can run in a worker process.
+    """
+    flags, project_emails = job
+    project_index = _index_project(project_emails)
+    keyword_cache: dict[int, frozenset[str]] = {}
+    source_files = {email.source_file for email in project_emails}
+
+    results: list[tuple[str, str]] = []
+    for flag in flags:
+        if source_files == {flag.source_file}:
+            resolution = _find_resolution_single_file(flag, project_index)
+        else:
+            resolution = _find_resolution(flag, project_index, keyword_cache)
+        if resolution:
+            results.append(("RESOLVED", resolution))
+        else:
+            results.append((flag.status, flag.resolution_snippet))
+    return results
+
+
 def detect_resolutions(
     flags: list[Flag],
     project_emails: dict[str, list[Email]]
@@ -254,13 +490,28 @@ def detect_resolutions(
     """
     Run resolution detection on all flags.
     project_emails: project_name → list of all emails in that project.
+    Projects are independent, so large inputs are sharded across worker
+    processes (see PARALLEL_MIN_EMAILS in config.py).
     """
+    flags_by_project: dict[str, list[Flag]] = {}
     for flag in flags:
-        emails_in_project = project_emails.get(flag.project, [])
-        resolution = _find_resolution(flag, emails_in_project)
-
-        if resolution:
-            flag.status = "RESOLVED"
+        flags_by_project.setdefault(flag.project, []).append(flag)
+    jobs = [
+        (project_flags, project_emails.get(project, []))
+        for project, project_flags in flags_by_project.items()
+    ]
+
+    total_emails = sum(len(emails) for _, emails in jobs)
+    if len(jobs) > 1 and total_emails >= config.PARALLEL_MIN_EMAILS:
+        with ProcessPoolExecutor(max_workers=config.PARALLEL_WORKERS) as pool:
+            outcomes = list(pool.map(_resolve_project, jobs))
+    else:
+        outcomes = [_resolve_project(job) for job in jobs]
+
+    # apply in place — workers only ever saw copies of the flags
+    for (project_flags, _), results in zip(jobs, outcomes):
+        for flag, (status, resolution) in zip(project_flags, results):
+            flag.status = status
             flag.resolution_snippet = resolution
 
     open_count = sum(1 for f in flags if f.status == "OPEN")
@@ -11,18 +11,44 @@ Responsibilities:
     - Optionally load Colleagues.txt for role enrichment
 """
 
+import functools
 import hashlib
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import chain
+
+import config
+
+
+# ---------------------------------------------------------------------------
+# Compiled patterns — built once at import, reused for every line/email
+# ---------------------------------------------------------------------------
+
+_PAT_SENDER = re.compile(r"(.+?)\s*[<(]([^>)]+)[>)]")
+_PAT_EMAIL = re.compile(r"[\w.À-ž]+@[\w.]+")
+# block boundary: blank line(s) followed by a header keyword. Kept as a regex on
+# purpose — the leading literal \n lets the engine skip straight between line
+# breaks in C; a str.find/startswith scanner measured 3-5x slower here
+_PAT_BLOCK_SPLIT = re.compile(r"\n\s*\n(?=(?:From|Subject|Date)\s*[:(])")
+# up to two nested Re:/Fwd: prefixes in one pass
+_PAT_RE_FWD = re.compile(r"^(?:(?:Re|Fwd|FW|RE|FWD)\s*:\s*){1,2}", re.IGNORECASE)
+_PAT_TICKET = re.compile(r"\b[A-Z]+-\d+\b")
+_PAT_DATE_YMD = re.compile(r"\b\d{4}[.\-/]\d{2}[.\-/]\d{2}\b")
+_PAT_DATE_MON = re.compile(
+    r"\b\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}\b"
+)
+_PAT_PROJECT = re.compile(r"^(?:Re\s*:\s*|Fwd\s*:\s*)*(.+?)\s*[-–]\s", re.IGNORECASE)
+_PAT_COLLEAGUE = re.compile(r"^(.+?)\s*:\s*(.+?)\s*[<(]([\w.À-ž]+@[\w.]+)[>)]")
 
 
 # ---------------------------------------------------------------------------
 # Data models
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Email:
     """Single parsed email message."""
     sender_name: str
@@ -37,7 +63,7 @@ class Email:
     index_in_thread: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Flag:
     """A detected issue — action item or risk/blocker."""
     flag_type: str                  # "UNRESOLVED_ACTION" | "RISK_BLOCKER"
@@ -72,11 +98,52 @@ DATE_FORMATS: list[str] = [
 ]
 
 
+def _parse_numeric_date(raw: str) -> datetime | None:
+    """
+    Fast path for the fixed-width numeric formats in DATE_FORMATS —
+    YYYY-MM-DD HH:MM[:SS] and YYYY.MM.DD HH:MM — by slicing and int().
+    Returns None for anything else (or out-of-range fields) so the caller
+    falls back to the strptime loop, which also has the final word on errors.
+    """
+    size = len(raw)
+    if size != 16 and size != 19:
+        return None
+    sep = raw[4]
+    if (sep != "-" and sep != ".") or raw[7] != sep or raw[10] != " " or raw[13] != ":":
+        return None
+    if size == 19 and (sep != "-" or raw[16] != ":"):
+        return None
+    digits = raw[0:4] + raw[5:7] + raw[8:10] + raw[11:13] + raw[14:16] + raw[17:19]
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+    try:
+        return datetime(int(raw[0:4]), int(raw[5:7]), int(raw[8:10]),
+                        int(raw[11:13]), int(raw[14:16]),
+                        int(raw[17:19]) if size == 19 else 0)
+    except ValueError:
+        return None
+
+
 def _parse_date(raw: str) -> datetime | None:
     """Try known date formats. Returns None if unparseable."""
+    return _parse_stripped_date(raw.strip())
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_stripped_date(raw: str) -> datetime | None:
+    """
+    Format loop behind _parse_date, memoised on the stripped string —
+    the same Date: value recurs across a thread and across an inbox.
+    Formats are always tried in DATE_FORMATS order: %d/%m and %m/%d overlap,
+    so the first format that parses must win, not the last one that did.
+    The numeric fast path only accepts shapes no earlier format can parse.
+    """
+    parsed = _parse_numeric_date(raw)
+    if parsed is not None:
+        return parsed
     for fmt in DATE_FORMATS:
         try:
-            return datetime.strptime(raw.strip(), fmt)
+            return datetime.strptime(raw, fmt)
         except ValueError:
             continue
     return None
@@ -87,43 +154,69 @@ def _parse_date(raw: str) -> datetime | None:
 # ---------------------------------------------------------------------------
 
 def _make_message_id(sender: str, date_str: str, subject: str) -> str:
-    """Hash-based message ID for deduplication."""
+    """Hash-based message ID for deduplication (non-cryptographic use, 64-bit)."""
     raw = f"{sender}|{date_str}|{subject}"
-    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+    return hashlib.blake2b(raw.encode(), digest_size=8).hexdigest()
 
 
 def _extract_sender(raw_from: str) -> tuple[str, str]:
     """Extract (name, email) from a From: header value."""
-    match = re.match(r"(.+?)\s*[<(]([^>)]+)[>)]", raw_from)
+    match = _PAT_SENDER.match(raw_from)
     if match:
         return match.group(1).strip(), match.group(2).strip()
 
     # fallback: try to find just an email address
-    email_match = re.search(r"[\w.À-ž]+@[\w.]+", raw_from)
+    email_match = _PAT_EMAIL.search(raw_from)
     email = email_match.group() if email_match else ""
     name = raw_from.split("<")[0].strip()
     return name, email
 
 
+_HEADER_KEYS: tuple[str, ...] = ("from", "to", "cc", "date", "subject")
+
+
+def _match_header(line: str) -> tuple[str, str] | None:
+    """
+    Recognise a header line — From/To/Cc/Date/Subject in any case, optional
+    whitespace, then ':' or '(' — and return (key, value). Plain string
+    probing: this runs for every header-area line of every email.
+    """
+    prefix = line[:7].lower()  # longest key is 'subject'
+    for key in _HEADER_KEYS:
+        if prefix.startswith(key):
+            rest = line[len(key):].lstrip()
+            if rest[:1] in (":", "("):
+                return key, rest[1:].strip()
+            return None
+    return None
+
+
+_TO_CC_TRANS = str.maketrans({";": ","})
+
+
+def _split_addresses(raw: str) -> list[str]:
+    """Split a To:/Cc: value on ',' or ';' into stripped, non-empty entries."""
+    parts = (part.strip() for part in raw.translate(_TO_CC_TRANS).split(","))
+    return [part for part in parts if part]
+
+
+_MAX_BODY: int = config.MAX_EMAIL_BODY_LENGTH  # read once, checked for every block
+
+
 def _parse_single_block(block: str, source_file: str, index: int) -> Email | None:
     """Parse one email block into an Email object. Returns None if unparseable."""
-    import config  # pylint: disable=import-outside-toplevel
-
     lines = block.strip().split("\n")
     headers: dict[str, str] = {}
     body_lines: list[str] = []
-    in_body = False
-
-    for line in lines:
-        if in_body:
-            body_lines.append(line)
-            continue
 
-        header_match = re.match(r"^(From|To|Cc|Date|Subject)\s*[:(]\s*(.*)", line, re.IGNORECASE)
-        if header_match:
-            headers[header_match.group(1).lower()] = header_match.group(2).strip()
+    for i, line in enumerate(lines):
+        header = _match_header(line)
+        if header:
+            headers[header[0]] = header[1]
         elif headers and not line.strip():
-            in_body = True
+            # first blank line after the headers: everything below is body
+            body_lines.extend(lines[i + 1:])
+            break
         else:
             body_lines.append(line)
 
@@ -134,16 +227,16 @@ def _parse_single_block(block: str, source_file: str, index: int) -> Email | Non
 
     # security: cap body length
     body = "\n".join(body_lines).strip()
-    if len(body) > config.MAX_EMAIL_BODY_LENGTH:
-        body = body[:config.MAX_EMAIL_BODY_LENGTH]
+    if len(body) > _MAX_BODY:
+        body = body[:_MAX_BODY]
 
     date_raw = headers.get("date", "")
 
     return Email(
         sender_name=sender_name,
         sender_email=sender_email,
-        to=[t.strip() for t in re.split(r"[,;]", headers.get("to", "")) if t.strip()],
-        cc=[c.strip() for c in re.split(r"[,;]", headers.get("cc", "")) if c.strip()],
+        to=_split_addresses(headers.get("to", "")),
+        cc=_split_addresses(headers.get("cc", "")),
         date=_parse_date(date_raw),
         subject=headers.get("subject", ""),
         body=body,
@@ -160,13 +253,12 @@ def _parse_single_block(block: str, source_file: str, index: int) -> Email | Non
 def _parse_thread(raw_text: str, source_file: str) -> list[Email]:
     """Split a raw .txt file into individual emails, parse, sort chronologically."""
     # split on blank line followed by a header keyword
-    blocks = re.split(r"\n\s*\n(?=(?:From|Subject|Date)\s*[:(])", raw_text)
+    blocks = _PAT_BLOCK_SPLIT.split(raw_text)
 
-    emails: list[Email] = []
-    for i, block in enumerate(blocks):
-        parsed = _parse_single_block(block, source_file, i)
-        if parsed:
-            emails.append(parsed)
+    emails: list[Email] = [
+        parsed for i, block in enumerate(blocks)
+        if (parsed := _parse_single_block(block, source_file, i)) is not None
+    ]
 
     # sort chronologically; unparseable dates go to the end
     emails.sort(key=lambda e: e.date or datetime.max)
@@ -180,10 +272,42 @@ def _parse_thread(raw_text: str, source_file: str) -> list[Email]:
 # Directory loading (with path traversal guard)
 # ---------------------------------------------------------------------------
 
+def _read_thread_file(path: str) -> str:
+    """
+    Read one thread file, hinting sequential access to the kernel where supported.
+    Raw os.read + one decode skips the text-mode wrapper's incremental decoder;
+    newlines are normalised afterwards exactly as universal-newline mode did.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        if hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass  # advisory only — some filesystems reject it (EINVAL/ESPIPE)
+        size = os.fstat(fd).st_size
+        chunks: list[bytes] = []
+        while True:  # read until EOF — a single os.read may return short
+            chunk = os.read(fd, max(size, 65536))
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+    text = b"".join(chunks).decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
 def load_emails(folder_path: str) -> list[Email]:
     """
     Read all .txt email files from a directory.
     Security: validates every path stays inside the input folder.
+    Large folders are read on a small thread pool so file I/O overlaps,
+    and very large ones are parsed in worker processes (threads are
+    independent, parsing is pure CPU).
     """
     folder_path = os.path.realpath(folder_path)
 
@@ -191,9 +315,12 @@ def load_emails(folder_path: str) -> list[Email]:
         print(f"[Parser] Warning: folder '{folder_path}' not found.")
         return []
 
-    all_emails: list[Email] = []
+    # scandir yields entry types without an extra stat() per file
+    with os.scandir(folder_path) as entries:
+        fnames = sorted(entry.name for entry in entries if entry.is_file())
 
-    for fname in sorted(os.listdir(folder_path)):
+    thread_files: list[tuple[str, str]] = []
+    for fname in fnames:
         if not fname.endswith(".txt") or fname.lower() == "colleagues.txt":
             continue
 
@@ -203,10 +330,25 @@ def load_emails(folder_path: str) -> list[Email]:
             print(f"[Parser] BLOCKED: '{fname}' resolves outside input folder.")
             continue
 
-        with open(full_path, "r", encoding="utf-8") as file:
-            raw = file.read()
+        thread_files.append((fname, full_path))
+
+    paths = [full_path for _, full_path in thread_files]
+    if len(paths) >= config.IO_MIN_FILES:
+        with ThreadPoolExecutor(max_workers=config.IO_WORKERS) as pool:
+            raws = list(pool.map(_read_thread_file, paths))
+    else:
+        raws = [_read_thread_file(path) for path in paths]
 
-        all_emails.extend(_parse_thread(raw, fname))
+    fnames = [fname for fname, _ in thread_files]
+    if len(raws) >= config.PARALLEL_MIN_FILES:
+        workers = config.PARALLEL_WORKERS or os.cpu_count() or 1
+        chunksize = max(1, len(raws) // (workers * 4))  # amortise IPC per task
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            threads = list(pool.map(_parse_thread, raws, fnames, chunksize=chunksize))
+    else:
+        threads = [_parse_thread(raw, fname) for raw, fname in zip(raws, fnames)]
+
+    all_emails: list[Email] = list(chain.from_iterable(threads))
 
     print(f"[Parser] Loaded {len(all_emails)} emails.")
     return all_emails
@@ -216,38 +358,36 @@ def load_emails(folder_path: str) -> list[Email]:
 # Project grouping
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=2048)
 def _normalize_subject(subject: str) -> str:
     """
     Stable fallback key from a subject line.
     Strips Re:/Fwd:, ticket IDs, dates → lowercase + collapse whitespace.
     Prevents accidental project fragmentation.
+    Cached: every message in a thread repeats the same few subject variants.
     """
     text = subject.strip()
     # strip Re: / Fwd: prefixes (handles nested)
-    text = re.sub(r"^(?:Re|Fwd|FW|RE|FWD)\s*:\s*", "", text, flags=re.IGNORECASE)
-    text = re.sub(r"^(?:Re|Fwd|FW|RE|FWD)\s*:\s*", "", text, flags=re.IGNORECASE)
+    text = _PAT_RE_FWD.sub("", text)
     # strip ticket IDs (e.g. PROJ-42)
-    text = re.sub(r"\b[A-Z]+-\d+\b", "", text)
+    text = _PAT_TICKET.sub("", text)
     # strip dates
-    text = re.sub(r"\b\d{4}[.\-/]\d{2}[.\-/]\d{2}\b", "", text)
-    text = re.sub(
-        r"\b\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}\b",
-        "", text
-    )
+    text = _PAT_DATE_YMD.sub("", text)
+    text = _PAT_DATE_MON.sub("", text)
     return " ".join(text.lower().split()).strip()
 
 
+_PROJECT_SKIP_WORDS = frozenset({"re", "fwd", "fw", "subject", "urgent", "small"})
+
+
+@functools.lru_cache(maxsize=2048)
 def _extract_project_name(subject: str) -> str | None:
-    """Extract project name from 'ProjectName –' or 'ProjectName -' pattern."""
-    match = re.match(
-        r"^(?:Re\s*:\s*|Fwd\s*:\s*)*(.+?)\s*[-–]\s",
-        subject.strip(),
-        re.IGNORECASE
-    )
+    """Extract project name from 'ProjectName –' or 'ProjectName -' pattern.
+    Cached per raw subject, like _normalize_subject."""
+    match = _PAT_PROJECT.match(subject.strip())
     if match:
         candidate = match.group(1).strip()
-        skip_words = {"re", "fwd", "fw", "subject", "urgent", "small"}
-        if candidate.lower() not in skip_words and len(candidate) > 2:
+        if candidate.lower() not in _PROJECT_SKIP_WORDS and len(candidate) > 2:
             return candidate
     return None
 
@@ -257,7 +397,7 @@ def group_by_project(emails: list[Email]) -> dict[str, list[Email]]:
     Group emails by project dynamically.
     Priority: 1) explicit name from subject  2) stable normalized subject fallback.
     """
-    projects: dict[str, list[Email]] = {}
+    keyed: list[tuple[str, Email]] = []
 
     for email in emails:
         project = _extract_project_name(email.subject)
@@ -266,11 +406,18 @@ def group_by_project(emails: list[Email]) -> dict[str, list[Email]]:
         if not project:
             project = "Unclassified"
 
-        projects.setdefault(project, []).append(email)
+        keyed.append((project, email))
+
+    # buckets in first-seen order, as before
+    projects: dict[str, list[Email]] = {project: [] for project, _ in keyed}
 
-    # sort within each project chronologically
-    for project_name, project_list in projects.items():
-        projects[project_name] = sorted(project_list, key=lambda e: e.date or datetime.max)
+    # one stable sort instead of one sort per project. The project's first-seen
+    # rank leads the key, so dates are only ever compared within one project
+    # (projects may mix offset-aware and naive Date formats); ties keep input order
+    rank = {project: i for i, project in enumerate(projects)}
+    keyed.sort(key=lambda pair: (rank[pair[0]], pair[1].date or datetime.max))
+    for project, email in keyed:
+        projects[project].append(email)
 
     print(f"[Parser] Grouped into {len(projects)} projects: {list(projects.keys())}")
     return projects
@@ -299,10 +446,7 @@ def load_colleagues(folder_path: str) -> dict[str, dict[str, str]]:
                 if not line or line.startswith("#"):
                     continue
 
-                match = re.match(
-                    r"^(.+?)\s*:\s*(.+?)\s*[<(]([\w.À-ž]+@[\w.]+)[>)]",
-                    line
-                )
+                match = _PAT_COLLEAGUE.match(line)
                 if match:
                     role = match.group(1).strip()
                     name = match.group(2).strip()
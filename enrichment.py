@@ -15,10 +15,15 @@ import json
 import os
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
 
 from email_parser import Flag
 import config
 
+if TYPE_CHECKING:  # annotations only — openai itself is imported lazily
+    import openai
+
 
 # ---------------------------------------------------------------------------
 # Prompts
@@ -51,15 +56,21 @@ JSON schema (return exactly this structure):
 """
 
 
-def _build_user_prompt(flag: Flag, role_map: dict[str, dict[str, str]]) -> str:
+def _build_role_index(role_map: dict[str, dict[str, str]]) -> tuple[tuple[str, str], ...]:
+    """(lowercased name, prompt line) per colleague — built once per enrichment run."""
+    return tuple(
+        (info["name"].lower(), f"  - {info['name']}: {info['role']}\n")
+        for info in role_map.values()
+    )
+
+
+def _build_user_prompt(flag: Flag, role_index: tuple[tuple[str, str], ...]) -> str:
     """Build user prompt with flag context injected dynamically.
     If the sender's role is known from Colleagues.txt, include it as context."""
     # extract sender email from the snippet is unreliable — use source_file to
     # look up all known roles and include any that appear in the snippet
-    role_context = ""
-    for _, info in role_map.items():
-        if info["name"].lower() in flag.trigger_snippet.lower():
-            role_context += f"  - {info['name']}: {info['role']}\n"
+    snippet_lower = flag.trigger_snippet.lower()
+    role_context = "".join(line for name, line in role_index if name in snippet_lower)
 
     prompt = (
         f"Flag type: {flag.flag_type}\n"
@@ -93,17 +104,19 @@ _INJECTION_PATTERNS: list[str] = [
     r"jailbreak",
 ]
 
+# each list folded into one alternation, compiled once — a single pass per snippet
+_INJECTION_RE = re.compile("|".join(f"(?:{p})" for p in _INJECTION_PATTERNS), re.IGNORECASE)
+_SENSITIVE_RE = re.compile("|".join(f"(?:{p})" for p in config.SENSITIVE_DATA_PATTERNS))
+
 
 def _strip_injection_attempts(text: str) -> str:
     """Sanitise text before sending to LLM. Removes prompt injection patterns."""
-    for pattern in _INJECTION_PATTERNS:
-        text = re.sub(pattern, "[SANITISED]", text, flags=re.IGNORECASE)
-    return text
+    return _INJECTION_RE.sub("[SANITISED]", text)
 
 
 def _contains_sensitive_data(text: str) -> bool:
     """Check if text contains credentials or secrets."""
-    return any(re.search(p, text) for p in config.SENSITIVE_DATA_PATTERNS)
+    return bool(_SENSITIVE_RE.search(text))
 
 
 # ---------------------------------------------------------------------------
@@ -157,16 +170,32 @@ def _validate_llm_output(raw_text: str) -> dict | None:
 # LLM client
 # ---------------------------------------------------------------------------
 
+_LLM_CLIENT: "openai.OpenAI | None" = None  # created on first use and reused afterwards
+
+
 def _api_key_available() -> bool:
     """Check if API key is set. Never prints or returns the key itself."""
     return bool(os.environ.get("OPENAI_API_KEY", "").strip())
 
 
-def _call_llm(model: str, flag: Flag, role_map: dict[str, dict[str, str]]) -> dict | None:
+def _get_client() -> "openai.OpenAI":
+    """Return the shared OpenAI client, constructing it on the first call.
+    One client means one httpx connection pool: TCP/TLS connections stay
+    alive across flags, tiers and repeated enrich_flags runs."""
+    global _LLM_CLIENT  # pylint: disable=global-statement
+    if _LLM_CLIENT is None:
+        import openai  # pylint: disable=import-outside-toplevel
+        _LLM_CLIENT = openai.OpenAI()  # reads OPENAI_API_KEY from env
+    return _LLM_CLIENT
+
+
+def _call_llm(client: "openai.OpenAI", model: str, flag: Flag,
+              role_index: tuple[tuple[str, str], ...]) -> dict | None:
     """
     Single LLM call with retry on RateLimitError (exponential backoff).
     Returns validated dict or None on any failure.
     Security: sanitises input, checks for sensitive data, never logs the key.
+    client is the shared one from _get_client(), used across calls and threads.
     """
     try:
         import openai  # pylint: disable=import-outside-toplevel
@@ -182,11 +211,9 @@ def _call_llm(model: str, flag: Flag, role_map: dict[str, dict[str, str]]) -> di
         # temporarily replace snippet with sanitised version for the prompt
         original_snippet = flag.trigger_snippet
         flag.trigger_snippet = safe_snippet
-        user_prompt = _build_user_prompt(flag, role_map)
+        user_prompt = _build_user_prompt(flag, role_index)
         flag.trigger_snippet = original_snippet  # restore
 
-        client = openai.OpenAI()  # reads OPENAI_API_KEY from env
-
         # retry loop: up to 5 attempts with exponential backoff for rate limits
         max_retries = 5
         for attempt in range(max_retries):
@@ -232,6 +259,18 @@ def _call_llm(model: str, flag: Flag, role_map: dict[str, dict[str, str]]) -> di
         return None
 
 
+def _call_tier(client: "openai.OpenAI", model: str, flags: list[Flag],
+               role_index: tuple[tuple[str, str], ...]) -> list[dict | None]:
+    """Run one tier's calls concurrently. Results come back in flag order.
+    Calls are network-bound and independent; LLM_CONCURRENCY caps in-flight
+    requests and the RateLimitError handler in _call_llm paces the rest."""
+    if len(flags) <= 1:
+        return [_call_llm(client, model, flag, role_index) for flag in flags]
+    workers = min(config.LLM_CONCURRENCY, len(flags))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda flag: _call_llm(client, model, flag, role_index), flags))
+
+
 def _apply_result(flag: Flag, data: dict) -> None:
     """Apply validated LLM output to a flag. Mutates in place."""
     if not data.get("is_genuine", False):
@@ -274,16 +313,20 @@ def enrich_flags(flags: list[Flag],
         print("[Enrichment] openai package not installed — run: pip install -r requirements.txt")
         return flags
 
+    try:
+        client = _get_client()
+    except Exception as err:  # pylint: disable=broad-except
+        print(f"[Enrichment] Could not create LLM client ({type(err).__name__}) — skipping.")
+        return flags
+
+    role_index = _build_role_index(role_map)
     open_flags = [f for f in flags if f.status == "OPEN"]
     print(f"[Enrichment] Tier 1: processing {len(open_flags)} open flags...")
 
     # --- Tier 1: cheap model ---
     tier1_high: list[Flag] = []
-    for i, flag in enumerate(open_flags):
-        if i > 0:
-            print("[Enrichment] Waiting 3s before next flag...")
-            time.sleep(3)
-        result = _call_llm(config.LLM_TIER1_MODEL, flag, role_map)
+    tier1_results = _call_tier(client, config.LLM_TIER1_MODEL, open_flags, role_index)
+    for flag, result in zip(open_flags, tier1_results):
         if result:
             _apply_result(flag, result)
             if flag.priority == "HIGH" and flag.status != "FALSE_POSITIVE":
@@ -293,11 +336,8 @@ def enrich_flags(flags: list[Flag],
     print(f"[Enrichment] Tier 2: re-analysing {len(tier1_high)} HIGH-priority flags...")
 
     # --- Tier 2: strong model, only HIGH priority ---
-    for i, flag in enumerate(tier1_high):
-        if i > 0:
-            print("[Enrichment] Waiting 3s before next flag...")
-            time.sleep(3)
-        result = _call_llm(config.LLM_TIER2_MODEL, flag, role_map)
+    tier2_results = _call_tier(client, config.LLM_TIER2_MODEL, tier1_high, role_index)
+    for flag, result in zip(tier1_high, tier2_results):
         if result:
             _apply_result(flag, result)
         # if Tier 2 fails, flag keeps Tier 1 data — no regression
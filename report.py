@@ -6,14 +6,17 @@ Rule: no statement appears without a direct email quote behind it.
 Header clearly states whether AI enrichment was used.
 """
 
+from collections import Counter
 from datetime import datetime
 
 from email_parser import Flag
 
+# double quotes inside a quote would close the italic "..." evidence block
+_QUOTE_TRANS = str.maketrans({'"': "'"})
 
-def _render_flag(flag: Flag, show_resolution: bool = False) -> str:
-    """Render a single flag as a Markdown block with evidence."""
-    lines: list[str] = []
+
+def _render_flag(lines: list[str], flag: Flag, show_resolution: bool = False) -> None:
+    """Append a single flag as a Markdown block with evidence."""
     lines.append(f"**[{flag.flag_type}]** — `{flag.source_file}`")
 
     if flag.owner:
@@ -23,33 +26,32 @@ def _render_flag(flag: Flag, show_resolution: bool = False) -> str:
     if flag.llm_summary:
         lines.append(f"  - 📝 {flag.llm_summary}")
 
-    lines.append(f'  - 📌 Evidence: *"{flag.trigger_snippet.replace(chr(34), chr(39))}"*')
+    lines.append(f'  - 📌 Evidence: *"{flag.trigger_snippet.translate(_QUOTE_TRANS)}"*')
 
     if show_resolution and flag.resolution_snippet:
-        lines.append(f'  - ✅ Resolution: *"{flag.resolution_snippet.replace(chr(34), chr(39))}"*')
-
-    return "\n".join(lines)
+        lines.append(f'  - ✅ Resolution: *"{flag.resolution_snippet.translate(_QUOTE_TRANS)}"*')
 
 
 def _render_project_section(
+    lines: list[str],
     project: str,
     open_flags: list[Flag],
     resolved_flags: list[Flag],
+    type_counts: Counter[tuple[str, str]],
     email_count: int,
-) -> list[str]:
-    """Render one project's full section. Returns list of Markdown lines."""
-    lines: list[str] = []
-
+) -> None:
+    """Append one project's full section to the report's Markdown lines.
+    type_counts: (status, flag_type) → count, tallied while partitioning."""
     lines.append(f"## 📁 {project}")
     lines.append("")
     lines.append(f"*Emails analysed: {email_count}*")
     lines.append("")
 
     # summary table
-    open_actions = sum(1 for f in open_flags if f.flag_type == "UNRESOLVED_ACTION")
-    open_risks = sum(1 for f in open_flags if f.flag_type == "RISK_BLOCKER")
-    res_actions = sum(1 for f in resolved_flags if f.flag_type == "UNRESOLVED_ACTION")
-    res_risks = sum(1 for f in resolved_flags if f.flag_type == "RISK_BLOCKER")
+    open_actions = type_counts["OPEN", "UNRESOLVED_ACTION"]
+    open_risks = type_counts["OPEN", "RISK_BLOCKER"]
+    res_actions = type_counts["RESOLVED", "UNRESOLVED_ACTION"]
+    res_risks = type_counts["RESOLVED", "RISK_BLOCKER"]
 
     lines.append("| Status | Action Items | Risks/Blockers |")
     lines.append("|---|---|---|")
@@ -62,7 +64,7 @@ def _render_project_section(
         lines.append("### 🔴 Requires Attention")
         lines.append("")
         for flag in open_flags:
-            lines.append(_render_flag(flag))
+            _render_flag(lines, flag)
             lines.append("")
 
     # resolved flags
@@ -70,7 +72,7 @@ def _render_project_section(
         lines.append("### 🟢 Recently Resolved")
         lines.append("")
         for flag in resolved_flags:
-            lines.append(_render_flag(flag, show_resolution=True))
+            _render_flag(lines, flag, show_resolution=True)
             lines.append("")
 
     # suggested next steps (deduplicated: one line per file + type)
@@ -96,7 +98,6 @@ def _render_project_section(
 
     lines.append("---")
     lines.append("")
-    return lines
 
 
 def generate_report(
@@ -112,6 +113,7 @@ def generate_report(
         project_email_counts: project_name → number of emails analysed
         ai_used:              whether LLM enrichment ran
     """
+    # every renderer appends to this one list; it is joined exactly once
     lines: list[str] = []
 
     # --- Header ---
@@ -129,17 +131,30 @@ def generate_report(
 
     project_open: dict[str, list[Flag]] = {}
     project_resolved: dict[str, list[Flag]] = {}
+    project_type_counts: dict[str, Counter[tuple[str, str]]] = {}
 
     for project, flags in project_flags.items():
-        open_flags = [f for f in flags if f.status == "OPEN"]
-        resolved_flags = [f for f in flags if f.status == "RESOLVED"]
+        # one pass: partition by status and tally flag types for the section table
+        open_flags: list[Flag] = []
+        resolved_flags: list[Flag] = []
+        type_counts: Counter[tuple[str, str]] = Counter()
+        for flag in flags:
+            status = flag.status
+            if status == "OPEN":
+                open_flags.append(flag)
+                type_counts[status, flag.flag_type] += 1
+            elif status == "RESOLVED":
+                resolved_flags.append(flag)
+                type_counts[status, flag.flag_type] += 1
+            elif status == "FALSE_POSITIVE":
+                total_filtered += 1
 
         project_open[project] = open_flags
         project_resolved[project] = resolved_flags
+        project_type_counts[project] = type_counts
 
         total_open += len(open_flags)
         total_resolved += len(resolved_flags)
-        total_filtered += sum(1 for f in flags if f.status == "FALSE_POSITIVE")
 
     lines.append("## Executive Summary")
     lines.append("")
@@ -155,11 +170,13 @@ def generate_report(
 
     # --- Per-Project Sections ---
     for project in sorted(project_flags.keys()):
-        lines.extend(_render_project_section(
+        _render_project_section(
+            lines,
             project=project,
             open_flags=project_open[project],
             resolved_flags=project_resolved[project],
+            type_counts=project_type_counts[project],
             email_count=project_email_counts.get(project, 0),
-        ))
+        )
 
     return "\n".join(lines)